@@ -1,6 +1,7 @@
 from typing import Optional, Union, List, Tuple, Dict, Callable
 from array import array
 import ROOT
+import numpy as np
 from .logger import package_logger
 from .process import Process
 from .constants import Style
@@ -14,7 +15,23 @@ class PanelElement: #TODO: Add suppport for other error propagation methods. i.e
         if not isinstance(hists[0], ROOT.TH1) or not isinstance(hists[1], ROOT.TH1):
             raise ValueError("Expected TH1 objects for PanelElement._divide")
         h_ratio = hists[0].Clone()
-        h_ratio.Divide(hists[1])
+
+        # Compute the ratio and its propagated error in one vectorized pass over the bin
+        # buffers instead of going through TH1::Divide; bins with an empty denominator are zeroed
+        n = h_ratio.GetNbinsX() + 2
+        c1 = np.frombuffer(hists[0].GetArray(), dtype=np.float64, count=n)
+        c2 = np.frombuffer(hists[1].GetArray(), dtype=np.float64, count=n)
+        e1_sq = _bin_errors_sq(hists[0], n)
+        e2_sq = _bin_errors_sq(hists[1], n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(c2 != 0, c1 / c2, 0.0)
+            err_sq = np.where(c2 != 0, (e1_sq * c2 * c2 + e2_sq * c1 * c1) / (c2 * c2 * c2 * c2), 0.0)
+
+        # Write the results back into the clone's content and sumw2 buffers
+        if h_ratio.GetSumw2N() == 0:
+            h_ratio.Sumw2()
+        np.frombuffer(h_ratio.GetArray(), dtype=np.float64, count=n)[:] = ratio
+        np.frombuffer(h_ratio.GetSumw2().GetArray(), dtype=np.float64, count=n)[:] = err_sq
         return h_ratio
 
 
@@ -170,7 +187,8 @@ class Histogram2D:
                  extra_tag: str = "",
                  panel: Optional[Panel] = None,
                  include_processes: Optional[List[str]] = None,
-                 exclude_processes: Optional[List[str]] = None):
+                 exclude_processes: Optional[List[str]] = None,
+                 compress_to_short: bool = False):
         """
         Initialize a 2D histogram configuration.
         
@@ -193,6 +211,7 @@ class Histogram2D:
             panel: Panel configuration
             include_processes: List of process names to include (if None, include all)
             exclude_processes: List of process names to exclude (if None, exclude none)
+            compress_to_short: Store as TH2S (16-bit bin contents) in the output file to halve its size
         """
         self.name = name
         self.variable_x = variable_x
@@ -212,12 +231,20 @@ class Histogram2D:
         self.panel = panel
         self.include_processes = include_processes
         self.exclude_processes = exclude_processes
+        self.compress_to_short = compress_to_short
 
         # Will store actual histograms
         self.histograms: List[Tuple[Process, ROOT.TH2F]] = []
         self.merged_histograms: Dict[str, ROOT.TH2F] = {}
 
 
+def _bin_errors_sq(h: ROOT.TH1, n: int) -> "np.ndarray":
+    """Squared bin errors as a numpy array: the sumw2 buffer when filled, otherwise the Poisson contents."""
+    if h.GetSumw2N():
+        return np.frombuffer(h.GetSumw2().GetArray(), dtype=np.float64, count=n)
+    return np.abs(np.frombuffer(h.GetArray(), dtype=np.float64, count=n))
+
+
 def _format_binning(binning: Union[Tuple[int, float, float], Tuple[int, Tuple[float, ...]]]) -> Union[Tuple[int, float, float], Tuple[int, "array[float]"]]:
     binning = list(binning)
     for i in range(len(binning)):
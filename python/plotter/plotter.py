@@ -1,6 +1,10 @@
 from typing import Optional, List, Dict, Tuple, Union
+from contextlib import contextmanager
 import ROOT
+import numpy as np
 import os
+import re
+import hashlib
 import logging
 from .region import Region
 from .histogram import Histogram, Histogram2D
@@ -14,10 +18,162 @@ TITLE_SIZE = 0.06
 TITLE_OFFSET = 1.1
 LABEL_SIZE = 0.06
 LEFT_MARGIN = 0.12
+MIN_ENTRIES_PER_THREAD = 500000
+
+# Panel axis attributes, derived once instead of per configured panel
+PANEL_LABEL_SIZE = LABEL_SIZE*SCALE_FACTOR
+PANEL_TITLE_SIZE = TITLE_SIZE*SCALE_FACTOR
+PANEL_TITLE_OFFSET_Y = TITLE_OFFSET*PANEL_RATIO
+
+def _setup_points(element) -> None:
+    h = element.histogram
+    h.SetMarkerStyle(20)
+    h.SetMarkerSize(1.2)
+
+
+def _setup_line(element) -> None:
+    pass
+
+
+def _setup_stacked(element) -> None:
+    # Configure the fill once per element; redraws with an unchanged color skip the setters
+    h = element.histogram
+    fill_color = element.color if element.color else h.GetLineColor()
+    if getattr(element, "_fill_cached", None) != fill_color:
+        h.SetFillColor(fill_color)
+        h.SetFillStyle(3004)
+        h.SetMarkerStyle(0)
+        h.SetMarkerSize(0)
+        element._fill_cached = fill_color
+
+
+# Style-specific histogram setup handlers for panel elements
+_STYLE_HANDLERS = {
+    Style.POINTS: _setup_points,
+    Style.LINE: _setup_line,
+    Style.STACKED: _setup_stacked,
+}
+
+# C++ functions already declared to Cling, keyed by (return type, expression); Cling state is
+# process-global so the cache is module-level and survives across Plotter instances
+_declared_funcs: Dict[Tuple[str, str], str] = {}
+
+# Numpy equivalents of the math functions appearing in C++ expression strings
+_NUMPY_FUNCS = {
+    "sqrt": np.sqrt, "abs": np.abs, "fabs": np.abs, "exp": np.exp, "log": np.log,
+    "log10": np.log10, "pow": np.power, "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh, "atan2": np.arctan2,
+    "min": np.minimum, "max": np.maximum,
+}
+
+def _numpy_not(x):
+    """Elementwise logical negation with C++ semantics: any nonzero value counts as true."""
+    return ~np.asarray(x, dtype=bool)
+
+
+def _translate_not(expr: str) -> str:
+    """Rewrite one layer of C++ ! negations as _not(...) calls.
+
+    A plain ~ translation is wrong for integer flag branches: C++ !1 is false but ~1 is -2,
+    which is truthy, so the operand must be coerced to bool before negating. The operand is
+    taken as a parenthesized group, an identifier, or a call with balanced parentheses.
+    """
+    out = []
+    i = 0
+    while i < len(expr):
+        if expr[i] == "!" and expr[i + 1:i + 2] != "=":
+            j = i + 1
+            while j < len(expr) and expr[j] == " ":
+                j += 1
+            start = j
+            while j < len(expr) and (expr[j].isalnum() or expr[j] == "_"):
+                j += 1
+            if j < len(expr) and expr[j] == "(":
+                depth = 0
+                while j < len(expr):
+                    if expr[j] == "(":
+                        depth += 1
+                    elif expr[j] == ")":
+                        depth -= 1
+                        if depth == 0:
+                            j += 1
+                            break
+                    j += 1
+            if j > start:
+                out.append(f"_not({expr[start:j]})")
+                i = j
+                continue
+        out.append(expr[i])
+        i += 1
+    return "".join(out)
+
+
+# Math function names that map directly onto the math module inside a numba kernel
+_NUMBA_MATH = {"sqrt", "exp", "log", "log10", "pow", "sin", "cos", "tan", "sinh", "cosh", "tanh", "atan2", "fabs"}
+
+# Fused numba kernels keyed by expression; None marks expressions that cannot be compiled
+_numba_kernels: Dict[str, Optional[tuple]] = {}
+
+
+def _compile_numba(expr: str) -> Optional[tuple]:
+    """Fuse an arithmetic expression into a parallel numba kernel.
+
+    Chained numpy operations allocate one temporary array per operation; the fused kernel
+    evaluates the whole expression in a single pass over the entries. Returns
+    (kernel, parameter names), or None when numba is unavailable or the expression is not
+    plain arithmetic over columns and known math functions.
+    """
+    if expr in _numba_kernels:
+        return _numba_kernels[expr]
+
+    compiled = None
+    try:
+        import numba
+        import math
+        if re.fullmatch(r"[A-Za-z0-9_+\-*/(), .]+", expr):
+            tokens = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", expr))
+            builtins_ok = {"abs", "min", "max"}
+            params = sorted(tokens - _NUMBA_MATH - builtins_ok)
+            if params:
+                # Rewrite column tokens as per-entry loads and math functions as math.* calls
+                def _rewrite(match):
+                    token = match.group(0)
+                    if token in params:
+                        return f"{token}[i]"
+                    if token in _NUMBA_MATH:
+                        return f"math.{token}"
+                    return token
+                scalar_expr = re.sub(r"[A-Za-z_][A-Za-z0-9_]*", _rewrite, expr)
+
+                source = (
+                    f"def _kernel({', '.join(params)}):\n"
+                    f"    out = np.empty(len({params[0]}), dtype=np.float64)\n"
+                    f"    for i in numba.prange(len(out)):\n"
+                    f"        out[i] = {scalar_expr}\n"
+                    f"    return out\n"
+                )
+                namespace = {"np": np, "math": math, "numba": numba}
+                exec(source, namespace)
+                compiled = (numba.njit(parallel=True, fastmath=True)(namespace["_kernel"]), params)
+    except ImportError:
+        pass
+
+    _numba_kernels[expr] = compiled
+    return compiled
+
+# Complete panel draw-option strings keyed on (style, error bars); stack elements are always error bands
+_DRAW_TABLE = {
+    (Style.POINTS, False): "P SAME",
+    (Style.POINTS, True): "P E X0 SAME",
+    (Style.LINE, False): "HIST SAME",
+    (Style.LINE, True): "HIST E X0 SAME",
+    (Style.STACKED, False): "E2 SAME",
+    (Style.STACKED, True): "E2 SAME",
+}
 
 
 class Plotter:
-    def __init__(self, output_dir: Optional[str] = "plots", weight: Optional[str] = "1", log_level: Optional[int] = logging.INFO, n_threads: Optional[int] = 32):
+    def __init__(self, output_dir: Optional[str] = "plots", weight: Optional[str] = "1", log_level: Optional[int] = logging.INFO, n_threads: Optional[int] = 32, multipage_pdf: Optional[bool] = False, backend: Optional[str] = "rdf", tree_cache_mb: Optional[int] = 100):
         """Initialize the plotter with ATLAS style settings."""
 
         # Set up logger
@@ -29,32 +185,88 @@ class Plotter:
         ROOT.gROOT.SetBatch(True)  # Run in batch mode
         ROOT.gErrorIgnoreLevel = ROOT.kWarning  # Only show warnings and above
 
-        # Set up ROOT threads
-        ROOT.ROOT.EnableImplicitMT(n_threads)
-
         # Set up processes and histograms
         self.regions: List[Region] = []
         self.histograms: List[Histogram] = []
         self.histograms2D: List[Histogram2D] = []
         self.processes: List[Process] = []
         self.unique_processes: List[ProcessTemplate] = []
+
+        # Name-keyed side indices for O(1) duplicate checks and lookups
+        self._regions_by_name: Dict[str, Region] = {}
+        self._hists_by_name: Dict[str, Histogram] = {}
+        self._hists2D_by_name: Dict[str, Histogram2D] = {}
+        self._unique_by_name: Dict[str, ProcessTemplate] = {}
+
+        # RDataFrames shared across processes reading the same (files, tree, format)
+        self._rdf_cache: Dict[tuple, ROOT.RDataFrame] = {}
+
+        # Processes keyed on everything that must match for their files to share one dataframe node
+        self._procs_by_key: Dict[tuple, Process] = {}
+
+        # Input TChains with masked branches; they must outlive the dataframes built on them
+        self._open_chains: List[ROOT.TChain] = []
+
+        # Filter/Define nodes keyed on (parent node, operation, expression) so identical
+        # subexpressions are jitted once and shared
+        self._node_cache: Dict[tuple, object] = {}
+
+        # Booked actions awaiting a RunGraphs event loop
+        self._pending_actions: List = []
+
+        # Bin maxima of merged histograms, cached at merge time and reused when plotting
+        self._hist_max: Dict[int, float] = {}
+
+        # Column names per node, fetched once for bare-column detection
+        self._columns_cache: Dict[int, set] = {}
         self.output_dir = output_dir
         self.weight = weight
-        
-        # Set ATLAS style
-        self._set_atlas_style()
-    
+        self.n_threads = n_threads
+        self.multipage_pdf = multipage_pdf
+        self.tree_cache_mb = tree_cache_mb
+
+        # Histogram fill backend: "rdf" (default) or "uproot" for bulk numpy reads of simple trees
+        if backend not in ("rdf", "uproot"):
+            self.logger.warning(f"Unknown backend {backend}. Falling back to rdf.")
+            backend = "rdf"
+        self.backend = backend
+
+        # Whether the multi-page PDF has been opened during this run
+        self._pdf_open = False
+
+        # ATLAS style is applied lazily when the first plot is made
+        self._style_set = False
+
+        # Shared TLatex for ATLAS labels, configured once and reused across all plots
+        self._atlas_latex = ROOT.TLatex()
+        self._atlas_latex.SetNDC()
+        self._atlas_latex.SetTextFont(43)
+        self._atlas_latex.SetTextSize(24)
+        self._atlas_latex.SetTextAlign(11)
+        self._label_cache: Dict[Tuple[str, str, str, str], List[Tuple[float, str]]] = {}
+
+        # Styles already warned about, to avoid log spam from a broken config shared by many panels
+        self._warned_styles: set = set()
+
+        # Per-process log lines, batched into one summary message at run() start
+        self._pending_process_log: List[str] = []
+
+        # Total entries over all input trees, summed while the prefetched files are open
+        # and reused for thread-pool sizing
+        self._total_entries = 0
+
 
     def add_region(self, region: Region) -> None:
         """Add a region to the plotter."""
 
         # Check if the region is already in the plotter
-        if region.name in [r.name for r in self.regions]:
+        if region.name in self._regions_by_name:
             self.logger.warning(f"Region {region.name} already exists. Will overwrite.")
             self.regions = [r for r in self.regions if r.name != region.name]
 
         # Add the region to the plotter
         self.regions.append(region)
+        self._regions_by_name[region.name] = region
         self.logger.info(f"Added region {region.name} to plotter")
         
 
@@ -63,12 +275,13 @@ class Plotter:
 
         if isinstance(histogram, Histogram):
             # Check if the histogram is already in the plotter
-            if histogram.name in [h.name for h in self.histograms]:
+            if histogram.name in self._hists_by_name:
                 self.logger.warning(f"Histogram {histogram.name} already exists in plotter. Will overwrite existing histogram.")
                 self.histograms = [h for h in self.histograms if h.name != histogram.name]
 
             # Add the histogram to the plotter
             self.histograms.append(histogram)
+            self._hists_by_name[histogram.name] = histogram
             self.logger.info(f"Added histogram {histogram.name} to plotter")
 
         elif isinstance(histogram, Histogram2D):
@@ -77,12 +290,13 @@ class Plotter:
                 self.logger.warning(f"Panel configuration for 2D histogram {histogram.name} is not yet implemented. Skipping panel plot.")
                 histogram.panel = None
             # Check if the histogram is already in the plotter
-            if histogram.name in [h.name for h in self.histograms2D]:
+            if histogram.name in self._hists2D_by_name:
                 self.logger.warning(f"Histogram {histogram.name} already exists in plotter. Will overwrite existing 2D histogram.")
                 self.histograms2D = [h for h in self.histograms2D if h.name != histogram.name]
 
             # Add the histogram to the plotter
             self.histograms2D.append(histogram)
+            self._hists2D_by_name[histogram.name] = histogram
             self.logger.info(f"Added 2D histogram {histogram.name} to plotter")
 
     
@@ -90,10 +304,12 @@ class Plotter:
         """Add a process to the plotter."""
 
         # Look for matching process template
-        process_template = next((p for p in self.unique_processes if p.name == process.name), None)
+        process_template = self._unique_by_name.get(process.name)
         if not process_template:
             # Append process template if not already present
-            self.unique_processes.append(ProcessTemplate(process.name, process.color, process.style, process.error_bars, process.label))
+            process_template = ProcessTemplate(process.name, process.color, process.style, process.error_bars, process.label)
+            self.unique_processes.append(process_template)
+            self._unique_by_name[process.name] = process_template
         else:
             # Throw warning if process template already exists with different color or stack setting
             if process.color != process_template.color:
@@ -105,15 +321,35 @@ class Plotter:
             if process.label != process_template.label:
                 self.logger.warning(f"Process {process.name} already exists with different label. Skipping label update from {process.file_path}:{process.tree_name}.")
 
-        # Add the process to the plotter
-        process.df = ROOT.RDataFrame(process.tree_name, process.file_path)
+        # Fold repeat campaigns of the same process into one multi-file process so a single
+        # graph is built and JITted and one event loop covers all its files
+        proc_key = (process.name, process.tree_name, process.weight, process.extra_selection, process.use_rntuple)
+        existing = self._procs_by_key.get(proc_key)
+        if existing:
+            for path in process.file_paths:
+                existing.add_file(path)
+            self._pending_process_log.append(f"{process.name}: chained {process.file_path}")
+            return
+        self._procs_by_key[proc_key] = process
+
+        # Add the process to the plotter; its dataframe is built in run() once the thread pool is configured
         self.processes.append(process)
-        self.logger.info(f"Added process {process.name} from {process.file_path}:{process.tree_name} to plotter")
+        self._pending_process_log.append(f"{process.name}: {process.file_path}:{process.tree_name}")
 
 
     def run(self) -> None:
         """Full pipeline ntuples to fancy plots."""
 
+        # Install the ATLAS style before any histogram is constructed: axis and line
+        # attributes are copied from gStyle at construction time and ForceStyle is not
+        # retroactive, so setting it at plot time would leave ROOT's default fonts
+        self._set_atlas_style()
+
+        # Emit one batched summary of the configured processes instead of a line per add
+        if self._pending_process_log:
+            self.logger.info("Processes added:\n" + "\n".join(self._pending_process_log))
+            self._pending_process_log = []
+
         # Create output directory
         if os.path.exists(self.output_dir):
             self.logger.warning(f"Output directory {self.output_dir} already exists. Plots will be saved in this directory.")
@@ -122,39 +358,82 @@ class Plotter:
         # Setup default region if none specified
         if not self.regions:
             self.logger.info("No regions specified. Adding default region 'nominal'.")
-            self.regions.append(Region("nominal", ""))
+            self.add_region(Region("nominal", ""))
 
-        # Make hists
-        self._make_hists()
-
-        # Merge hists
-        for hist in self.histograms + self.histograms2D:
+        if self.backend == "uproot":
+            # Bulk-read the required branches with uproot and fill with vectorized numpy,
+            # bypassing the RDF JIT entirely
+            self._fill_hists_numpy()
+        else:
+            # Start opening all input files concurrently and validate them as the opens complete
+            self._prefetch_files()
+
+            # Enable implicit MT before any RDataFrame is constructed; ROOT only parallelizes
+            # dataframes created while IMT is on
+            if ROOT.ROOT.IsImplicitMTEnabled():
+                ROOT.ROOT.DisableImplicitMT()
+            ROOT.ROOT.EnableImplicitMT(self._tune_thread_count())
+
+            # Build the shared dataframes now that the thread pool is configured
+            self._build_dataframes()
+
+            # Book and execute all histogram actions in one event loop
+            self._book_hists()
+            self._execute()
+
+        # Merge, write and plot one histogram at a time, releasing its memory before moving to the
+        # next so peak RSS is bounded by a single histogram's merged set rather than the whole analysis
+        all_hists = [*self.histograms, *self.histograms2D]
+        merger = ROOT.TBufferMerger(os.path.join(self.output_dir, "merged_histograms.root"), "RECREATE", ROOT.ROOT.CompressionSettings(ROOT.ROOT.kZSTD, 5))
+        merger.SetAutoSave(256*1024)  # Accumulate small histogram buffers and merge in 256 kB batches
+        for hist in all_hists:
             hist.merged_histograms = self._merge_hists(hist)
-        self.logger.info("Histograms merged")
 
-        # Add underflow and overflow to histograms
-        for hist in self.histograms:
-            self._add_underflow_overflow(hist)
-
-        output_file = ROOT.TFile(os.path.join(self.output_dir, "merged_histograms.root"), "RECREATE")
-        for hist in self.histograms + self.histograms2D:
-            for region in hist.merged_histograms:   
-                for proc in self.unique_processes:
-                    if proc.name in hist.merged_histograms[region]:
-                        hist.merged_histograms[region][proc.name].Write(f"{hist.name}_{region}_{proc.name}")
-        output_file.Close()
-        self.logger.info("Merged histograms saved to merged_histograms.root")
-
-        # Make plots
-        if self.histograms:
-            self._make_plots()
-        if self.histograms2D:
-            self._make_2D_plots()
+            # Add underflow and overflow before writing
+            if isinstance(hist, Histogram):
+                self._add_underflow_overflow(hist)
+
+                # Cache bin maxima now so plotting doesn't rescan every histogram
+                for region_hists in hist.merged_histograms.values():
+                    for h in region_hists.values():
+                        self._hist_max[id(h)] = self._fast_max(h)
+
+            # Write this histogram's merged set and hand the buffer to the merger
+            merger_file = merger.GetFile()
+            merger_file.cd()
+            for region, region_hists in hist.merged_histograms.items():
+                for proc_name, h_out in region_hists.items():
+                    if isinstance(hist, Histogram2D) and hist.compress_to_short:
+                        h_out = self._to_short(h_out)
+                    h_out.Write(f"{hist.name}_{region}_{proc_name}")
+            merger_file.Write()
+
+            # Drop the shared file handle right away: TBufferMerger aborts if any of its
+            # files is still alive when the merger itself is destroyed
+            merger_file = None
+
+            # Plot this histogram while its merged set is still resident
+            if isinstance(hist, Histogram):
+                self._make_plots(hist)
+            else:
+                self._make_2D_plots(hist)
+
+            # Drop the RDF results and merged histograms now that they are written and plotted
+            hist.histograms = []
+            hist.merged_histograms = {}
+            self._hist_max.clear()
+        del merger  # Flushes remaining buffers and closes the output file
+        self.logger.info("Histograms merged and saved to merged_histograms.root")
+
+        # Close the multi-page PDF if one was opened
+        self._close_pdf()
         self.logger.info("All plots created")
 
 
     def _set_atlas_style(self) -> None:
         """Set ATLAS plot style."""
+        if self._style_set:
+            return
         style = ROOT.TStyle("ATLAS", "ATLAS style")
         
         # Canvas
@@ -203,80 +482,557 @@ class Plotter:
         ROOT.gStyle = style
         ROOT.gROOT.SetStyle("ATLAS")
         ROOT.gROOT.ForceStyle()
+        self._style_set = True
 
 
-    def _make_hists(self) -> None:
-        """Process all histograms using RDataFrame."""
-        actions = []
-        
+    def _book_hists(self) -> None:
+        """Book all histograms lazily; nothing runs until _execute."""
+
+        # Filtered and weighted nodes per (process, region), built once and shared by all histograms
+        df_cache = {}
+
+        # Defined columns per (node, expression) so histograms sharing a variable share one jitted Define
+        define_cache = {}
+
+        # Weight column per (process, region) node; None when the weight is the trivial constant
+        weight_cols = {}
+
+        # Snapshot histograms booked by a previous call so re-entry only books new ones
+        all_hists = [*self.histograms, *self.histograms2D]
+        already_booked = {id(h) for h in all_hists if h.histograms}
+
+        # Precompute which processes survive the region/histogram filters
+        filter_table = self._build_filter_table()
+
         # Loop over all regions
         for region in self.regions:
 
-            # Filter histograms
-            histograms_to_use = self._filter_histograms(self.histograms + self.histograms2D, region.include_histograms, region.exclude_histograms)
-            if not histograms_to_use:
-                self.logger.warning(f"No histograms found after filtering region {region.name}. Skipping region. This region is pointless")
-                continue
+            # Loop over histogram configurations surviving the filters
+            for hist in all_hists:
 
-            # Filter processes
-            processes_to_use = self._filter_processes(self.processes, region.include_processes, region.exclude_processes)
-            if not processes_to_use:
-                self.logger.warning(f"No processes found after filtering region {region.name}. Skipping region as all histograms would be 0. This region is pointless")
-                continue
+                # Skip histograms already booked by a previous _book_hists call
+                if id(hist) in already_booked:
+                    continue
 
-            # Loop over filtered histogram configurations
-            for hist in histograms_to_use:
-                
-                # Filter processes
-                processes_to_use = self._filter_processes(processes_to_use, hist.include_processes, hist.exclude_processes)
+                processes_to_use = filter_table.get((region.name, hist.name))
                 if not processes_to_use:
-                    self.logger.warning(f"No processes found after filtering histogram {hist.name} in region {region.name}. Skipping histogram as all processes would be 0. This region/histogram combination is pointless")
                     continue
 
                 # Loop over selected processes
                 for proc in processes_to_use:
 
-                    # Apply selection if any
-                    df = proc.df
-                    if region.selection:
-                        selection = region.selection
+                    # Build the filtered and weighted node for this (process, region) once; the selection
+                    # is then evaluated a single time per event no matter how many histograms are booked
+                    cache_key = (id(proc), region.name)
+                    df = df_cache.get(cache_key)
+                    if df is None:
+                        df = proc.df
+
+                        # Apply selection if any; always-true selections are folded away instead
+                        # of booking a Filter that runs per event
+                        selection = region.selection if region.selection and region.selection.strip() not in ("1", "true") else ""
                         if proc.extra_selection:
-                            selection += f" && {proc.extra_selection}"
-                        df = df.Filter(selection)
-                    
-                    # Use process-specific weight if specified, otherwise use plotter weight
-                    weight = proc.weight if proc.weight else self.weight
-                    df = df.Define("total_weight", weight)
+                            selection = f"{selection} && {proc.extra_selection}" if selection else proc.extra_selection
+                        if selection:
+                            # Precompile simple cut expressions; the Filter then JITs a trivial call
+                            df = self._cached_filter(df, self._compile_expression(df, selection, return_type="bool") or selection)
+
+                        # Use process-specific weight if specified, otherwise use plotter weight.
+                        # Unit factors are folded out of pure products, and a trivial unit weight
+                        # skips the Define so histograms are booked unweighted.
+                        weight = proc.weight if proc.weight else self.weight
+                        if re.fullmatch(r"[\w.]+(\s*\*\s*[\w.]+)+", weight):
+                            factors = [fct.strip() for fct in weight.split("*")]
+                            weight = "*".join(fct for fct in factors if fct not in ("1", "1.0", "1.f")) or "1"
+                        if weight.strip() in ("1", "1.0", "1.f"):
+                            weight_cols[cache_key] = None
+                        else:
+                            # Precompile simple weight products; the Define then JITs a trivial call
+                            df = self._cached_define(df, "total_weight", self._compile_expression(df, weight) or weight)
+                            weight_cols[cache_key] = "total_weight"
+                        df_cache[cache_key] = df
 
                     # Create histogram name
                     hist_name = f"{hist.name}_{region.name}_{proc.name}"
 
-                    # Book histogram depending on dimensionality
+                    # Book histogram depending on dimensionality; column names carry the histogram name
+                    # so they don't collide across histograms sharing the same node, and identical
+                    # variable expressions reuse the already-defined column instead of rejitting
+                    weight_col = weight_cols[cache_key]
                     if isinstance(hist, Histogram):
                         h_model = ROOT.RDF.TH1DModel(*((hist_name, "") + hist.binning))
-                        df = df.Define("plot_var", hist.variable)
-                        h = df.Histo1D(h_model, "plot_var", "total_weight")
+                        df, var_col = self._define_plot_var(df_cache, define_cache, cache_key, df, f"plot_var_{hist.name}", hist.variable)
+                        h = df.Histo1D(h_model, var_col, weight_col) if weight_col else df.Histo1D(h_model, var_col)
                     elif isinstance(hist, Histogram2D):
                         h_model = ROOT.RDF.TH2DModel(*((hist_name, "") + hist.binning_x + hist.binning_y))
-                        df = df.Define("plot_var_x", hist.variable_x)
-                        df = df.Define("plot_var_y", hist.variable_y)
-                        h = df.Histo2D(h_model, "plot_var_x", "plot_var_y", "total_weight")
+                        df, var_col_x = self._define_plot_var(df_cache, define_cache, cache_key, df, f"plot_var_{hist.name}_x", hist.variable_x)
+                        df, var_col_y = self._define_plot_var(df_cache, define_cache, cache_key, df, f"plot_var_{hist.name}_y", hist.variable_y)
+                        h = df.Histo2D(h_model, var_col_x, var_col_y, weight_col) if weight_col else df.Histo2D(h_model, var_col_x, var_col_y)
                     else:
                         self.logger.error(f"Invalid histogram type: {type(hist)}. Skipping histogram.")
                         continue
 
-                    # Add histogram to RDF.RunGraphs actions
-                    actions.append(h)
-                    
+                    # Add histogram to the pending RDF.RunGraphs actions
+                    self._pending_actions.append(h)
+
                     # Store in histogram object
                     hist.histograms.append((region.name, proc.name, h))
-        
+
+
+    def _build_filter_table(self) -> Dict[Tuple[str, str], List[Process]]:
+        """Precompute the processes surviving the region and histogram include/exclude filters."""
+        table = {}
+        all_hists = [*self.histograms, *self.histograms2D]
+        for region in self.regions:
+
+            # Filter histograms
+            histograms_to_use = self._filter_histograms(all_hists, region.include_histograms, region.exclude_histograms)
+            if not histograms_to_use:
+                self.logger.warning(f"No histograms found after filtering region {region.name}. Skipping region. This region is pointless")
+                continue
+
+            # Filter processes
+            region_processes = self._filter_processes(self.processes, region.include_processes, region.exclude_processes)
+            if not region_processes:
+                self.logger.warning(f"No processes found after filtering region {region.name}. Skipping region as all histograms would be 0. This region is pointless")
+                continue
+
+            # Filter processes per histogram
+            for hist in histograms_to_use:
+                processes_to_use = self._filter_processes(region_processes, hist.include_processes, hist.exclude_processes)
+                if not processes_to_use:
+                    self.logger.warning(f"No processes found after filtering histogram {hist.name} in region {region.name}. Skipping histogram as all processes would be 0. This region/histogram combination is pointless")
+                    continue
+                table[(region.name, hist.name)] = processes_to_use
+
+        return table
+
+
+    def _fill_hists_numpy(self) -> None:
+        """Fill all histograms with the uproot backend: bulk-read each file once and fill with vectorized numpy."""
+        import uproot  # Deferred so the default backend does not require it
+
+        required = self._required_columns()
+        filter_table = self._build_filter_table()
+        all_hists = [*self.histograms, *self.histograms2D]
+
+        # Output histograms per (histogram config, region, process), filled across files
+        out_hists: Dict[tuple, Union[ROOT.TH1D, ROOT.TH2D]] = {}
+
+        for proc in self.processes:
+            for path in proc.file_paths:
+
+                # One bulk read of the required branches; uproot returns contiguous numpy arrays
+                with uproot.open(path) as f:
+                    tree = f[proc.tree_name]
+                    branches = [b for b in tree.keys() if b in required]
+                    arrays = tree.arrays(branches, library="np")
+
+                for region in self.regions:
+
+                    # Apply selection if any, mirroring the RDF path: always-true region
+                    # selections are folded away and a process extra_selection applies on its own
+                    selection = region.selection if region.selection and region.selection.strip() not in ("1", "true") else ""
+                    if proc.extra_selection:
+                        selection = f"{selection} && {proc.extra_selection}" if selection else proc.extra_selection
+                    mask = None
+                    if selection:
+                        mask = np.asarray(self._eval_numpy(selection, arrays), dtype=bool)
+
+                    # Use process-specific weight if specified, otherwise use plotter weight.
+                    # A trivial unit weight fills unweighted.
+                    weight = proc.weight if proc.weight else self.weight
+                    weights = None
+                    if weight.strip() not in ("1", "1.0", "1.f"):
+                        weights = np.asarray(self._eval_expr(weight, arrays), dtype=np.float64)
+                        if mask is not None:
+                            weights = weights[mask]
+
+                    for hist in all_hists:
+                        processes_to_use = filter_table.get((region.name, hist.name))
+                        if not processes_to_use or proc not in processes_to_use:
+                            continue
+
+                        # Get or create the output histogram for this (hist, region, process)
+                        key = (id(hist), region.name, proc.name)
+                        h = out_hists.get(key)
+                        if h is None:
+                            hist_name = f"{hist.name}_{region.name}_{proc.name}"
+                            if isinstance(hist, Histogram):
+                                h = ROOT.TH1D(*((hist_name, "") + hist.binning))
+                            else:
+                                h = ROOT.TH2D(*((hist_name, "") + hist.binning_x + hist.binning_y))
+                            h.SetDirectory(ROOT.nullptr)
+                            out_hists[key] = h
+                            hist.histograms.append((region.name, proc.name, h))
+
+                        # Evaluate the plot variable(s) and fill in one vectorized pass
+                        if isinstance(hist, Histogram):
+                            values = self._eval_expr(hist.variable, arrays)
+                            if mask is not None:
+                                values = values[mask]
+                            self._fill_1d_numpy(h, values, weights)
+                        else:
+                            values_x = self._eval_expr(hist.variable_x, arrays)
+                            values_y = self._eval_expr(hist.variable_y, arrays)
+                            if mask is not None:
+                                values_x = values_x[mask]
+                                values_y = values_y[mask]
+                            self._fill_2d_numpy(h, values_x, values_y, weights)
+
+        self.logger.info("Histograms filled with uproot backend.")
+
+
+    def _eval_expr(self, expr: str, arrays: Dict[str, np.ndarray]):
+        """Evaluate an expression over column arrays, preferring a fused numba kernel when one can be built."""
+        compiled = _compile_numba(expr)
+        if compiled:
+            kernel, params = compiled
+            if all(p in arrays for p in params):
+                return kernel(*(arrays[p] for p in params))
+        return self._eval_numpy(expr, arrays)
+
+
+    def _eval_numpy(self, expr: str, arrays: Dict[str, np.ndarray]):
+        """Evaluate a C++-style expression string over numpy column arrays.
+
+        The C++ boolean operators are translated to numpy's elementwise ones; the
+        parenthesization around && and || compensates for & and | binding tighter
+        than comparisons in Python.
+        """
+        # Negations are rewritten innermost-out on the raw expression, before the &&/|| rewrite
+        # breaks up parenthesized groups like !(a && b); each pass resolves one layer of !
+        rewritten = _translate_not(expr)
+        while rewritten != expr:
+            expr = rewritten
+            rewritten = _translate_not(expr)
+
+        translated = "(" + expr.replace("&&", ") & (").replace("||", ") | (") + ")"
+
+        namespace = {**_NUMPY_FUNCS, "_not": _numpy_not, **arrays}
+        return eval(translated, {"__builtins__": {}}, namespace)
+
+
+    @staticmethod
+    def _fill_1d_numpy(h: ROOT.TH1D, values: np.ndarray, weights: Optional[np.ndarray]) -> None:
+        """Accumulate values into a TH1 with a single FillN call (tight C++ loop, proper sumw2 and under/overflow)."""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        if weights is None:
+            weights = np.ones(len(values), dtype=np.float64)
+        else:
+            weights = np.ascontiguousarray(weights, dtype=np.float64)
+        if h.GetSumw2N() == 0:
+            h.Sumw2()
+        h.FillN(len(values), values, weights)
+
+
+    @staticmethod
+    def _fill_2d_numpy(h: ROOT.TH2D, values_x: np.ndarray, values_y: np.ndarray, weights: Optional[np.ndarray]) -> None:
+        """Accumulate values into a TH2 via vectorized pre-binning.
+
+        Per-entry 2D fills touch a near-random bin each time; pre-binning both axes with
+        digitize and reducing with bincount builds the dense content array in one
+        sequential pass, which is then added to the bin buffer in ROOT's global-bin
+        layout (binx + (nx+2)*biny, under/overflow included).
+        """
+        if len(values_x) == 0:
+            return
+        nx, ny = h.GetNbinsX(), h.GetNbinsY()
+        edges_x = np.array([h.GetXaxis().GetBinLowEdge(i) for i in range(1, nx + 2)])
+        edges_y = np.array([h.GetYaxis().GetBinLowEdge(i) for i in range(1, ny + 2)])
+
+        # digitize numbers bins exactly like ROOT: 0 is underflow, n+1 overflow
+        bin_x = np.digitize(values_x, edges_x)
+        bin_y = np.digitize(values_y, edges_y)
+        n_cells = (nx + 2) * (ny + 2)
+        global_bins = bin_x + (nx + 2) * bin_y
+        contents = np.bincount(global_bins, weights=weights, minlength=n_cells)
+
+        # Per-bin sum of squared weights, so weighted errors match the FillN path of the 1D fill;
+        # unweighted fills have w*w == w and can reuse the contents
+        errors = np.bincount(global_bins, weights=weights * weights, minlength=n_cells) if weights is not None else contents
+
+        # Add into the content and sumw2 buffers in one sequential pass each
+        if h.GetSumw2N() == 0:
+            h.Sumw2()
+        buf = np.frombuffer(h.GetArray(), dtype=np.float64, count=n_cells)
+        buf += contents
+        sumw2_buf = np.frombuffer(h.GetSumw2().GetArray(), dtype=np.float64, count=n_cells)
+        sumw2_buf += errors
+
+        # Direct buffer writes bypass the statistics accumulators (fTsumw etc.), so rebuild
+        # them from the bin contents, then restore the raw entry count ResetStats overwrites
+        entries = h.GetEntries() + len(values_x)
+        h.ResetStats()
+        h.SetEntries(entries)
+
+
+    def _execute(self) -> None:
+        """Run a single event loop over all pending booked actions."""
+        if not self._pending_actions:
+            return
+
         # Process all actions in parallel
         self.logger.info("Launching booked RDataFrame actions. This may take a while...")
-        ROOT.RDF.RunGraphs(actions)
+        ROOT.RDF.RunGraphs(self._pending_actions)
+        self._pending_actions = []
         self.logger.info("RDataFrame actions processed. Hists created.")
 
 
+    def _cached_filter(self, df, expr: str):
+        """Filter a node, reusing an identical Filter already built on the same parent."""
+        key = (id(df), "Filter", expr)
+        node = self._node_cache.get(key)
+        if node is None:
+            node = df.Filter(expr)
+            self._node_cache[key] = node
+        return node
+
+
+    def _cached_define(self, df, name: str, expr: str):
+        """Define a column, reusing an identical Define already built on the same parent."""
+        key = (id(df), "Define", name, expr)
+        node = self._node_cache.get(key)
+        if node is None:
+            node = df.Define(name, expr)
+            self._node_cache[key] = node
+        return node
+
+
+    def _node_columns(self, df) -> set:
+        """Column names available on a node, fetched once per node."""
+        columns = self._columns_cache.get(id(df))
+        if columns is None:
+            columns = {str(c) for c in df.GetColumnNames()}
+            self._columns_cache[id(df)] = columns
+        return columns
+
+
+    def _is_bare_column(self, df, expr: str) -> bool:
+        """Check whether an expression is just the name of an existing column."""
+        expr = expr.strip()
+        return expr.isidentifier() and expr in self._node_columns(df)
+
+
+    def _compile_expression(self, df, expr: str, return_type: str = "double") -> Optional[str]:
+        """Precompile a simple arithmetic expression as a C++ function and return the call string, or None if the expression is not precompilable.
+
+        Declaring the body once via gInterpreter.Declare leaves only a trivial call for the
+        per-run RDataFrame JIT instead of re-jitting the full expression every run.
+        """
+
+        # Only plain arithmetic/comparisons over known columns are worth (and safe for) precompiling
+        if not re.fullmatch(r"[A-Za-z0-9_+\-*/().&|!<>= ]+", expr):
+            return None
+        params = sorted(set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", expr)))
+        if not params:
+            return None
+        columns = self._node_columns(df)
+        if not all(p in columns for p in params):
+            return None
+
+        # Declaring parameters as double would change integer semantics versus the raw jitted
+        # string (e.g. nJets/2 is integer division in C++), so bail out unless every column is
+        # already floating point
+        for p in params:
+            if str(df.GetColumnType(p)) not in ("float", "double", "Float_t", "Double_t"):
+                return None
+
+        key = (return_type, expr)
+        func = _declared_funcs.get(key)
+        if func is None:
+            func = f"plotter_expr_{hashlib.blake2b(f'{return_type} {expr}'.encode(), digest_size=8).hexdigest()}"
+            args = ", ".join(f"double {p}" for p in params)
+            ROOT.gInterpreter.Declare(f"inline {return_type} {func}({args}) {{ return {expr}; }}")
+            _declared_funcs[key] = func
+        return f"{func}({', '.join(params)})"
+
+
+    def _define_plot_var(self, df_cache, define_cache, cache_key, df, column, expr):
+        """Define a plot-variable column on a shared node, reusing the column if the expression was already defined there."""
+
+        # Expressions that are just a branch name need no Define at all
+        if self._is_bare_column(df, expr):
+            return df, expr.strip()
+
+        cached_col = define_cache.get((cache_key, expr))
+        if cached_col is not None:
+            return df, cached_col
+        df = self._cached_define(df, column, expr)
+        df_cache[cache_key] = df
+        define_cache[(cache_key, expr)] = column
+        return df, column
+
+
+    @staticmethod
+    def _to_short(h: ROOT.TH2D) -> ROOT.TH2S:
+        """Downcast a TH2D to 16-bit bin contents for storage."""
+
+        # Rebuild each axis as it is on the source: variable-binned axes must pass their bin
+        # edges or the Add below fails ROOT's bin-limit check and writes an empty histogram
+        x_axis, y_axis = h.GetXaxis(), h.GetYaxis()
+        x_bins, y_bins = x_axis.GetXbins(), y_axis.GetXbins()
+        x_args = (h.GetNbinsX(), x_bins.GetArray()) if x_bins.GetSize() else (h.GetNbinsX(), x_axis.GetXmin(), x_axis.GetXmax())
+        y_args = (h.GetNbinsY(), y_bins.GetArray()) if y_bins.GetSize() else (h.GetNbinsY(), y_axis.GetXmin(), y_axis.GetXmax())
+        h_short = ROOT.TH2S(h.GetName(), h.GetTitle(), *x_args, *y_args)
+        h_short.Add(h)
+        return h_short
+
+
+    @staticmethod
+    def _fast_max(h: ROOT.TH1D) -> float:
+        """Maximum bin content via the bin buffer (single vectorized pass, skips under/overflow)."""
+        n = h.GetNbinsX()
+        return float(np.frombuffer(h.GetArray(), dtype=np.float64, count=n + 2)[1:n + 1].max())
+
+
+    def _prefetch_files(self) -> None:
+        """Open all input files asynchronously so open latency is overlapped rather than paid per file.
+
+        Also serves as the file validation step: a path that cannot be opened raises here,
+        before any dataframe is built. Entry counts for the thread-pool sizing are read
+        while each file is open, so no file is reopened later just for GetEntries.
+        """
+        handles = {}
+        trees_by_path: Dict[str, set] = {}
+        for process in self.processes:
+            for path in process.file_paths:
+                trees_by_path.setdefault(path, set()).add(process.tree_name)
+                if path not in handles:
+                    handles[path] = ROOT.TFile.AsyncOpen(path)
+
+        # Finalize the overlapped opens; failures surface as unusable files
+        self._total_entries = 0
+        for path, handle in handles.items():
+            f = ROOT.TFile.Open(handle)
+            if not f or f.IsZombie():
+                self.logger.error(f"File not found or unreadable: {path}")
+                raise FileNotFoundError(f"File not found or unreadable: {path}")
+            for tree_name in trees_by_path[path]:
+                tree = f.Get(tree_name)
+                if tree:
+                    self._total_entries += tree.GetEntries()
+            f.Close()
+
+
+    def _build_dataframes(self) -> None:
+        """Construct the shared RDataFrames, one per unique (file, tree), after IMT is configured."""
+        required = self._required_columns()
+        for process in self.processes:
+            rdf_key = (tuple(process.file_paths), process.tree_name, process.use_rntuple)
+            if rdf_key not in self._rdf_cache:
+                if process.use_rntuple:
+                    self._rdf_cache[rdf_key] = self._make_rntuple_dataframe(process.file_paths, process.tree_name)
+                else:
+                    self._rdf_cache[rdf_key] = self._make_dataframe(process.file_paths, process.tree_name, required)
+            process.df = self._rdf_cache[rdf_key]
+
+
+    def _required_columns(self) -> set:
+        """Collect the identifier tokens appearing in any configured variable, selection or weight expression."""
+        expressions = [self.weight]
+        for region in self.regions:
+            expressions.append(region.selection)
+        for process in self.processes:
+            expressions.append(process.weight)
+            expressions.append(process.extra_selection)
+        for hist in self.histograms:
+            expressions.append(hist.variable)
+        for hist in self.histograms2D:
+            expressions.append(hist.variable_x)
+            expressions.append(hist.variable_y)
+
+        tokens = set()
+        for expr in expressions:
+            if expr:
+                tokens.update(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", expr))
+        return tokens
+
+
+    def _make_dataframe(self, file_paths: List[str], tree_name: str, required: set) -> ROOT.RDataFrame:
+        """Build an RDataFrame over one or more files with only the required branches enabled."""
+
+        # Chain all files of the process so one event loop covers them, largest first so the
+        # scheduler hands out the big files early and the tail tasks come from small ones
+        if len(file_paths) > 1:
+            file_paths = sorted(file_paths, key=self._file_size, reverse=True)
+        chain = ROOT.TChain(tree_name)
+        for path in file_paths:
+            chain.Add(path)
+
+        # Size the tree cache so baskets are prefetched in bulk instead of read on demand;
+        # the short learn phase picks up any branches read beyond the explicitly cached ones
+        chain.SetCacheSize(self.tree_cache_mb * 1024 * 1024)
+        chain.SetCacheLearnEntries(100)
+
+        # Deserialize only the branches the configured expressions actually touch; the token set
+        # also contains function names etc., which the intersection with real branches drops.
+        # The branch list is read from the first file since all files of a process share the schema.
+        f = ROOT.TFile.Open(file_paths[0])
+        tree = f.Get(tree_name) if f and not f.IsZombie() else None
+        if not tree:
+            self.logger.error(f"Could not read {tree_name} from {file_paths[0]} for branch masking. Reading all branches.")
+        else:
+            needed = required & {b.GetName() for b in tree.GetListOfBranches()}
+            if needed:
+                chain.SetBranchStatus("*", 0)
+                for branch in needed:
+                    chain.SetBranchStatus(branch, 1)
+                    chain.AddBranchToCache(branch, True)
+            else:
+                chain.AddBranchToCache("*", True)
+        if f:
+            f.Close()
+
+        # Keep the chain alive for the lifetime of the dataframe
+        self._open_chains.append(chain)
+        return ROOT.RDataFrame(chain)
+
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """File size for scheduling order; remote or unreadable paths sort last."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+
+    def _make_rntuple_dataframe(self, file_paths: List[str], tree_name: str) -> ROOT.RDataFrame:
+        """Build an RDataFrame over cached RNTuple conversions of the input files.
+
+        RNTuple's columnar layout only reads the requested fields, so no branch masking is needed.
+        """
+        ntuple_name = tree_name.split("/")[-1]
+        converted = [self._rntuple_path(path, tree_name, ntuple_name) for path in file_paths]
+        return ROOT.RDataFrame(ntuple_name, converted)
+
+
+    def _rntuple_path(self, file_path: str, tree_name: str, ntuple_name: str) -> str:
+        """Convert a tree to an RNTuple cached next to the source file, reusing the cache while the source is unchanged."""
+        cached_path = f"{os.path.splitext(file_path)[0]}.rntuple.root"
+        if os.path.isfile(cached_path) and os.path.getmtime(cached_path) >= os.path.getmtime(file_path):
+            return cached_path
+        self.logger.info(f"Converting {file_path}:{tree_name} to RNTuple at {cached_path}. This only happens when the source changes.")
+        importer = ROOT.Experimental.RNTupleImporter.Create(file_path, tree_name, cached_path)
+        importer.SetNTupleName(ntuple_name)
+        importer.Import()
+        return cached_path
+
+
+    def _tune_thread_count(self) -> int:
+        """Pick the implicit MT pool size, scaled down for small workloads where per-thread histogram clones outweigh the parallel gain."""
+
+        # Use fewer threads if the workload, counted during the prefetch, is too small to feed the full pool
+        total_entries = self._total_entries
+        n_threads_needed = max(1, min(self.n_threads, total_entries // MIN_ENTRIES_PER_THREAD))
+        if n_threads_needed < self.n_threads:
+            self.logger.info(f"Small workload ({total_entries} entries). Reducing thread count from {self.n_threads} to {n_threads_needed}.")
+        return n_threads_needed
+
+
     def _filter_histograms(self, histograms: List[Histogram], include_histograms: Optional[List[str]] = None, exclude_histograms: Optional[List[str]] = None) -> List[Histogram]:
         """Filter histograms based on include and exclude lists."""
         if include_histograms:
@@ -305,20 +1061,39 @@ class Plotter:
         return filtered_processes
 
 
+    @staticmethod
+    def _result_value(h):
+        """Materialized histogram behind a result: RDF result pointers need GetValue, plain TH1s are returned as is."""
+        return h.GetValue() if hasattr(h, "GetValue") else h
+
+
     def _merge_hists(self, hist: Union[Histogram, Histogram2D]) -> Dict[str, Union[ROOT.TH1D, ROOT.TH2D]]:
         """Merge histograms from processes with the same name."""
         merged = {}
-        
-        # Group histograms by process name
+
+        # Group results by (region, proc) first so each group can pick the cheapest merge strategy
+        groups = {}
         for region, proc, h in hist.histograms:
-            if region not in merged:
-                merged[region] = {}
-            if proc not in merged[region]:
-                # Clone first histogram for this process
-                merged[region][proc] = h.Clone()
-            else:
-                # Add subsequent histograms
-                merged[region][proc].Add(h.Clone())
+            groups.setdefault(region, {}).setdefault(proc, []).append(h)
+
+        for region, procs in groups.items():
+            merged[region] = {}
+            for proc, results in procs.items():
+                if len(results) == 1:
+                    # Single source: use the result directly, no clone needed
+                    merged[region][proc] = self._result_value(results[0])
+                elif len(results) == 2:
+                    # Clone the first histogram and add the second
+                    merged[region][proc] = results[0].Clone()
+                    merged[region][proc].Add(self._result_value(results[1]))
+                else:
+                    # Larger groups: reduce in one C++ TH1::Merge pass over a TList
+                    h_merged = results[0].Clone()
+                    merge_list = ROOT.TList()
+                    for h in results[1:]:
+                        merge_list.Add(self._result_value(h))
+                    h_merged.Merge(merge_list)
+                    merged[region][proc] = h_merged
 
         #TODO: Check if merged hists are consistent with included/excluded histograms by regions/hists
 
@@ -346,129 +1121,155 @@ class Plotter:
                 hist.merged_histograms[region][proc].Add(temp_hist)
 
 
-    def _make_plots(self) -> None:
-        """Create and save all plots."""
-        for hist in self.histograms:
-
-            for region in hist.merged_histograms:   
-                # Create canvas
-                canvas_name = f"canvas_{hist.name}_{region}"
-                canvas = ROOT.TCanvas(canvas_name, canvas_name, 800, 600)
-
-                # Configure pads/canvas
-                if hist.panel:
-                    upper_pad, lower_pad = self._configure_pads(canvas, hist)
-                    if not upper_pad or not lower_pad:
-                        continue
-                    upper_pad.cd()
-                else:
-                    canvas.SetRightMargin(0.08) #TODO: configure canvas function
-                    if hist.log_y:
-                        canvas.SetLogy()
-                    if hist.log_x:
-                        canvas.SetLogx()
-                    canvas.cd()
-
-                # Format histograms, create blueprint histogram
-                self._format_hists(hist.merged_histograms[region])
-                blueprint = list(hist.merged_histograms[region].values())[0].Clone()
-                blueprint.Reset()
-                blueprint.Draw()
-
-                # Create legend with adjusted position and size
-                legend = ROOT.TLegend(0.60, 0.6, 0.90, 0.92)
-                legend.SetBorderSize(0)
-                legend.SetFillStyle(0)
-
-                # Separate stacked and unstacked processes
-                stacked_hists, unstacked_hists = self._separate_hists(hist.merged_histograms[region])
-
-                # Draw histograms
-                cached_stack, cached_stack_total = self._draw_stack(hist, stacked_hists, legend)
-                cached_hists = self._draw_unstacked_hists(unstacked_hists, legend)
-
-                # Configure axes
-                max_height = max([h.GetMaximum() for h in cached_hists] + ([cached_stack_total.GetMaximum()] if cached_stack_total else []))
-                self._configure_axes(hist, blueprint, max_height=max_height)
-                ROOT.gPad.RedrawAxis()
-
-                # Draw legend
-                legend.Draw()
-                
-                # Draw ATLAS label
-                self._draw_atlas_label(tag=hist.tag, ecm=hist.ecm, lumi=hist.lumi, extra_tag=hist.extra_tag, has_panel=bool(hist.panel))
-                
-                # Handle ratio plot if configured
-                if hist.panel:
-                    lower_pad.cd()
-                    
-                    # Initialize y_max if automatic range finding enabled
-                    if not hist.panel.y_max: y_max = 0.
-
-                    # Loop over panel elements
-                    for element in hist.panel.elements:
-
-                        # Retrieve histograms for each value
-                        value_hists = []
-                        for value in element.values:
-                            if value == "stack":
-                                value_hists.append(cached_stack_total.Clone())
-                            else:
-                                value_hists.append(next((hist.merged_histograms[region][p.name] for p in self.unique_processes if p.name == value), None))
-                                if not value_hists[-1]:
-                                    self.logger.error(f"Process {value} not found in merged histograms for hist {hist.name}")
-                                    continue
-                        if not all(value_hists):
-                            self.logger.error(f"Skipping panel element as one or more histograms could not be retrieved.")
-                            continue
-
-                        # Apply function to get the histogram for the panel element
-                        element.histogram = element.func(tuple(value_hists))
+    def _make_plots(self, hist: Histogram) -> None:
+        """Create and save the plots for one histogram configuration."""
+        self._set_atlas_style()
 
-                        # Set errors to zero for the case of no error bars
-                        if not element.error_bars:
-                            for i in range(1, element.histogram.GetNbinsX() + 1):
-                                element.histogram.SetBinError(i, 0)
+        # Collect all plots into a single multi-page PDF if configured, avoiding per-plot file open/close
+        pdf_path = os.path.join(self.output_dir, "plots.pdf") if self.multipage_pdf else None
 
-                        # Find the maximum if automatic range finding enabled
-                        if not hist.panel.y_max:
-                            for i in range(1, element.histogram.GetNbinsX() + 1):
-                                bin_content = element.histogram.GetBinContent(i)
-                                y_max = max(y_max, bin_content)
+        for region in hist.merged_histograms:
+            # Hoist the per-region dict out of the plot-building code
+            region_hists = hist.merged_histograms[region]
 
-                    # Set y-max
-                    if not hist.panel.y_max: y_max /= 0.9
+            # Create canvas
+            canvas_name = f"canvas_{hist.name}_{region}"
+            canvas = ROOT.TCanvas(canvas_name, canvas_name, 800, 600)
 
-                    # Draw panel
-                    panel_blueprint = hist.panel.elements[0].histogram.Clone()
-                    panel_blueprint.Reset()
-                    panel_blueprint.Draw()
-                    panel_blueprint.GetYaxis().SetRangeUser(hist.panel.y_min, hist.panel.y_max if hist.panel.y_max else y_max)
-                    self._configure_panel_axes(panel_blueprint, hist)
+            # Configure pads/canvas
+            if hist.panel:
+                upper_pad, lower_pad = self._configure_pads(canvas, hist)
+                if not upper_pad or not lower_pad:
+                    continue
+                upper_pad.cd()
+            else:
+                canvas.SetRightMargin(0.08) #TODO: configure canvas function
+                if hist.log_y:
+                    canvas.SetLogy()
+                if hist.log_x:
+                    canvas.SetLogx()
+                canvas.cd()
+
+            # Format histograms, create blueprint histogram
+            self._format_hists(region_hists)
+            blueprint = next(iter(region_hists.values())).Clone()
+            blueprint.Reset()
+            blueprint.Draw()
+
+            # Create legend with adjusted position and size
+            legend = ROOT.TLegend(0.60, 0.6, 0.90, 0.92)
+            legend.SetBorderSize(0)
+            legend.SetFillStyle(0)
+
+            # Separate stacked and unstacked processes
+            stacked_hists, unstacked_hists = self._separate_hists(region_hists)
+
+            # Draw histograms
+            cached_stack, cached_stack_total = self._draw_stack(hist, stacked_hists, legend)
+            cached_hists = self._draw_unstacked_hists(unstacked_hists, legend)
+
+            # Configure axes
+            max_height = max([self._hist_max[id(h)] for h in cached_hists] + ([self._fast_max(cached_stack_total)] if cached_stack_total else []))
+            self._configure_axes(hist, blueprint, max_height=max_height)
+            ROOT.gPad.RedrawAxis()
+
+            # Draw legend
+            legend.Draw()
+
+            # Draw ATLAS label
+            self._draw_atlas_label(tag=hist.tag, ecm=hist.ecm, lumi=hist.lumi, extra_tag=hist.extra_tag, has_panel=bool(hist.panel))
+
+            # Handle ratio plot if configured
+            if hist.panel:
+                lower_pad.cd()
+
+                # Initialize y_max if automatic range finding enabled
+                if not hist.panel.y_max: y_max = 0.
+
+                # Loop over panel elements
+                for element in hist.panel.elements:
+
+                    # Retrieve histograms for each value
+                    value_hists = []
+                    for value in element.values:
+                        if value == "stack":
+                            # No clone needed, element funcs clone before modifying
+                            value_hists.append(cached_stack_total)
+                        else:
+                            value_hists.append(region_hists.get(value))
+                            if not value_hists[-1]:
+                                self.logger.error(f"Process {value} not found in merged histograms for hist {hist.name}")
+                                continue
+                    if not all(value_hists):
+                        self.logger.error(f"Skipping panel element as one or more histograms could not be retrieved.")
+                        continue
 
-                    # Draw elements
-                    cached_panel_hists = []
+                    # Apply function to get the histogram for the panel element
+                    element.histogram = element.func(tuple(value_hists))
+
+                    # Set errors to zero for the case of no error bars
+                    if not element.error_bars:
+                        for i in range(1, element.histogram.GetNbinsX() + 1):
+                            element.histogram.SetBinError(i, 0)
+
+                    # Find the maximum if automatic range finding enabled
+                    if not hist.panel.y_max:
+                        for i in range(1, element.histogram.GetNbinsX() + 1):
+                            bin_content = element.histogram.GetBinContent(i)
+                            y_max = max(y_max, bin_content)
+
+                # Set y-max
+                if not hist.panel.y_max: y_max /= 0.9
+
+                # Draw panel
+                panel_blueprint = hist.panel.elements[0].histogram.Clone()
+                panel_blueprint.Reset()
+                panel_blueprint.Draw()
+                panel_blueprint.GetYaxis().SetRangeUser(hist.panel.y_min, hist.panel.y_max if hist.panel.y_max else y_max)
+                self._configure_panel_axes(panel_blueprint, hist)
+
+                # Draw elements, deferring the pad repaint until all are drawn
+                cached_panel_hists = []
+                with self._pad_hold(lower_pad):
                     for element in hist.panel.elements:
                         cached_panel_hists.append(self._draw_panel_element(element))
 
-                    # Draw reference line(s)
-                    lines = []
-                    for line_height, line_color in zip(hist.panel.reference_line_heights, hist.panel.reference_line_colors):
-                        lines.append(ROOT.TLine(panel_blueprint.GetXaxis().GetXmin(), line_height, panel_blueprint.GetXaxis().GetXmax(), line_height))
-                        lines[-1].SetLineStyle(2)
-                        lines[-1].SetLineColor(line_color)
-                        lines[-1].Draw("SAME")
-                    ROOT.gPad.RedrawAxis()
-                        
-                # Save canvas
-                canvas.Update()
+                # Draw reference line(s)
+                lines = []
+                for line_height, line_color in zip(hist.panel.reference_line_heights, hist.panel.reference_line_colors):
+                    lines.append(ROOT.TLine(panel_blueprint.GetXaxis().GetXmin(), line_height, panel_blueprint.GetXaxis().GetXmax(), line_height))
+                    lines[-1].SetLineStyle(2)
+                    lines[-1].SetLineColor(line_color)
+                    lines[-1].Draw("SAME")
+                ROOT.gPad.RedrawAxis()
+
+            # Save canvas
+            canvas.Update()
+            if pdf_path:
+                if not self._pdf_open:
+                    canvas.Print(f"{pdf_path}[")  # Open the multi-page file without printing
+                    self._pdf_open = True
+                canvas.Print(pdf_path)
+                self.logger.info(f"Plot added to plots.pdf: {hist.name}_{region}")
+            else:
                 canvas.SaveAs(os.path.join(self.output_dir, f"{hist.name}_{region}.pdf"))
-                canvas.Close()
                 self.logger.info(f"Plot saved: {hist.name}_{region}.pdf")
+            canvas.Close()
+
+
+    def _close_pdf(self) -> None:
+        """Close the multi-page PDF if one was opened."""
+        if not self._pdf_open:
+            return
+        closer = ROOT.TCanvas("pdf_closer", "pdf_closer")
+        closer.Print(os.path.join(self.output_dir, "plots.pdf") + "]")  # Close the file without printing
+        closer.Close()
+        self._pdf_open = False
 
 
-    def _make_2D_plots(self) -> None:
-        """ Create and save all 2D plots."""
+    def _make_2D_plots(self, hist: Histogram2D) -> None:
+        """ Create and save the plots for one 2D histogram configuration."""
+        self._set_atlas_style()
         """
         # Create custom palette
         import array
@@ -482,41 +1283,40 @@ class Plotter:
         ROOT.gStyle.SetNumberContours(ncontours)
         """
 
-        for hist in self.histograms2D:
-            for region in hist.merged_histograms:
-                for proc in hist.merged_histograms[region]:
-                    # Create canvas
-                    canvas_name = f"canvas_{hist.name}_{region}"
-                    canvas = ROOT.TCanvas(canvas_name, canvas_name, 1000, 800)
-                    canvas.SetRightMargin(0.20)
-                    if hist.log_x:
-                        canvas.SetLogx()
-                    if hist.log_y:
-                        canvas.SetLogy()
-                    if hist.log_z:
-                        canvas.SetLogz()
-                    canvas.cd()
-
-                    # Format histogram
-                    h = hist.merged_histograms[region][proc]
-                    h.SetMinimum(0.001)  # Set white below this value
-                    h.Draw("COLZ")
-
-                    # Configure axes
-                    self._configure_axes(hist, h)
-
-                    # Move x-axis exponent that overlaps with z-axis
-                    ROOT.TGaxis.SetExponentOffset(0., -0.07, "x")
-
-                    # Draw ATLAS label
-                    self._draw_atlas_label(tag=hist.tag, ecm=hist.ecm, lumi=hist.lumi, extra_tag=hist.extra_tag, has_panel=bool(hist.panel))
-
-                    # Save canvas
-                    canvas.SaveAs(os.path.join(self.output_dir, f"{h.GetName()}.pdf"))
-                    canvas.Close()
-
-                    # Return x-axis exponent offset to default
-                    ROOT.TGaxis.SetExponentOffset()
+        for region in hist.merged_histograms:
+            for proc in hist.merged_histograms[region]:
+                # Create canvas
+                canvas_name = f"canvas_{hist.name}_{region}"
+                canvas = ROOT.TCanvas(canvas_name, canvas_name, 1000, 800)
+                canvas.SetRightMargin(0.20)
+                if hist.log_x:
+                    canvas.SetLogx()
+                if hist.log_y:
+                    canvas.SetLogy()
+                if hist.log_z:
+                    canvas.SetLogz()
+                canvas.cd()
+
+                # Format histogram
+                h = hist.merged_histograms[region][proc]
+                h.SetMinimum(0.001)  # Set white below this value
+                h.Draw("COLZ")
+
+                # Configure axes
+                self._configure_axes(hist, h)
+
+                # Move x-axis exponent that overlaps with z-axis
+                ROOT.TGaxis.SetExponentOffset(0., -0.07, "x")
+
+                # Draw ATLAS label
+                self._draw_atlas_label(tag=hist.tag, ecm=hist.ecm, lumi=hist.lumi, extra_tag=hist.extra_tag, has_panel=bool(hist.panel))
+
+                # Save canvas
+                canvas.SaveAs(os.path.join(self.output_dir, f"{h.GetName()}.pdf"))
+                canvas.Close()
+
+                # Return x-axis exponent offset to default
+                ROOT.TGaxis.SetExponentOffset()
                 
 
 
@@ -556,7 +1356,7 @@ class Plotter:
         for proc_name, h in merged_hists.items():
 
             # Find process template
-            proc = next((p for p in self.unique_processes if p.name == proc_name), None)
+            proc = self._unique_by_name.get(proc_name)
             if not proc:
                 self.logger.error(f"Process template {proc_name} not found when formatting merged histogram {h.GetName()}")
                 continue
@@ -581,12 +1381,12 @@ class Plotter:
 
 
     def _separate_hists(self, merged_hists: Dict[str, ROOT.TH1D]) -> Tuple[List[ROOT.TH1D], List[ROOT.TH1D]]:
-        """Separate stacked and unstacked processes."""
+        """Separate stacked and unstacked processes. Returns the merged histograms themselves; downstream code must not mutate them."""
         stacked_hists = []
         unstacked_hists = []
         for proc in self.unique_processes:
             if proc.name in merged_hists:
-                h = merged_hists[proc.name].Clone()
+                h = merged_hists[proc.name]
                 if proc.style == Style.STACKED:
                     stacked_hists.append((proc, h))
                 else:
@@ -703,83 +1503,106 @@ class Plotter:
         """Draw ATLAS label."""
 
         spacing = 0.08 if has_panel else 0.08*(1 - PANEL_RATIO)
-        label = ROOT.TLatex()
-        label.SetNDC()
-        label.SetTextFont(43)
-        label.SetTextSize(24)
-        label.SetTextAlign(11)            
-        label.DrawLatex(x, y, "#font[72]{ATLAS} " + tag)
-
-        lumi_label = ROOT.TLatex()
-        lumi_label.SetNDC()
-        lumi_label.SetTextFont(43)
-        lumi_label.SetTextSize(24)
-        lumi_label.SetTextAlign(11)
-        lumi_label.DrawLatex(x, y - spacing, "#sqrt{s} = " + ecm + " TeV, L = " + lumi + " fb^{-1}")
-        
-        if extra_tag:
-            extra_label = ROOT.TLatex()
-            extra_label.SetNDC()
-            extra_label.SetTextFont(43)
-            extra_label.SetTextSize(24)
-            extra_label.SetTextAlign(11)
-            extra_label.DrawLatex(x, y - 2*spacing, extra_tag)
+
+        # Reuse the shared configured TLatex; DrawLatex clones internally for the pad display list
+        label = self._atlas_latex
+
+        # Format the label lines once per (tag, lumi, ecm, extra_tag) combination
+        cache_key = (tag, lumi, ecm, extra_tag)
+        lines = self._label_cache.get(cache_key)
+        if lines is None:
+            lines = [(0.0, f"#font[72]{{ATLAS}} {tag}"), (1.0, f"#sqrt{{s}} = {ecm} TeV, L = {lumi} fb^{{-1}}")]
+            if extra_tag:
+                lines.append((2.0, extra_tag))
+            self._label_cache[cache_key] = lines
+
+        for offset, text in lines:
+            label.DrawLatex(x, y - offset*spacing, text)
 
     
     def _draw_panel_element(self, element) -> ROOT.TH1D:
         """Draw ratio points."""
 
-        # Setup draw options. Default color should be color of 1st agrument of the element.
-        if element.color:
-            element.histogram.SetMarkerColor(element.color)
-        draw_options = ""
-        if element.style == Style.POINTS:
-            element.histogram.SetMarkerStyle(20)
-            element.histogram.SetMarkerSize(1.2)
-            draw_options += "P"
-        elif element.style == Style.LINE:
-            draw_options += "HIST"
-        elif element.style == Style.STACKED and element.error_bars:
-            draw_options += "E2"
-            element.histogram.SetFillColor(element.color if element.color else element.histogram.GetLineColor())
-            element.histogram.SetFillStyle(3004)
-            element.histogram.SetMarkerStyle(0)
-            element.histogram.SetMarkerSize(0)
-        elif element.style == Style.STACKED and not element.error_bars:
-            self.logger.warning(f"Requested to draw stack panel element with no error bars. Stack panel elements are just error bars centered at 1 so this element will not be drawn.") 
-            return element.histogram
-        else:
-            self.logger.error(f"Unsupported style: {element.style} for panel element. Drawing in style {Style.LINE}.")
-            draw_options += "HIST"
-
-        # Setup draw options for errors if configured
-        if element.error_bars and element.style != Style.STACKED:
-            draw_options += " E X0"
+        # Bind hot attributes to locals once
+        h = element.histogram
+        style = element.style
+        color = element.color
+        error_bars = bool(element.error_bars)
+
+        # Default color should be color of 1st agrument of the element. Skip the setter on redraws with an unchanged color.
+        if color and getattr(element, "_last_marker_color", None) != color:
+            h.SetMarkerColor(color)
+            element._last_marker_color = color
+
+        # Stack panel elements without error bars have nothing to show
+        if style == Style.STACKED and not error_bars:
+            self.logger.warning(f"Requested to draw stack panel element with no error bars. Stack panel elements are just error bars centered at 1 so this element will not be drawn.")
+            return h
+
+        # Dispatch style-specific histogram setup; unknown styles get the LINE setup (none)
+        _STYLE_HANDLERS.get(style, _setup_line)(element)
+
+        # Look up the precomputed draw options
+        draw_options = _DRAW_TABLE.get((style, error_bars))
+        if draw_options is None:
+            if style not in self._warned_styles:
+                self.logger.warning("Unsupported style %s for panel element. Drawing in style %s.", style, Style.LINE)
+                self._warned_styles.add(style)
+            draw_options = _DRAW_TABLE[(Style.LINE, error_bars)]
 
         # Draw histogram
-        element.histogram.Draw(draw_options + " SAME")
+        h.Draw(draw_options)
 
-        return element.histogram
+        return h
     
     
+    @contextmanager
+    def _pad_hold(self, pad=None):
+        """Suppress intermediate repaints while a batch of pad mutations runs, then redraw once."""
+        if pad is None:
+            pad = ROOT.gPad
+        if pad:
+            pad.SetEditable(False)
+        try:
+            yield
+        finally:
+            if pad:
+                pad.SetEditable(True)
+                pad.Modified()
+                pad.Update()
+
+
     def _configure_panel_axes(self, h_ratio, hist) -> None:
         """Configure ratio plot axes."""
-        
-        # Set axis labels and ranges
-        h_ratio.GetXaxis().SetTitle(hist.x_label)
-        h_ratio.GetYaxis().SetTitle(hist.panel.y_label)
-        #h_ratio.GetYaxis().SetRangeUser(hist.panel.y_min, hist.panel.y_max)
-        
-        # Adjust sizes for ratio panel
-        h_ratio.GetXaxis().SetLabelSize(LABEL_SIZE*SCALE_FACTOR)
-        h_ratio.GetXaxis().SetTitleSize(TITLE_SIZE*SCALE_FACTOR)
-        h_ratio.GetXaxis().SetTitleOffset(TITLE_OFFSET)
-        h_ratio.GetYaxis().SetLabelSize(LABEL_SIZE*SCALE_FACTOR)
-        h_ratio.GetYaxis().SetTitleSize(TITLE_SIZE*SCALE_FACTOR)
-        h_ratio.GetYaxis().SetTitleOffset(TITLE_OFFSET*PANEL_RATIO)
-        
-        # Prevent label overlap
-        h_ratio.GetXaxis().SetMaxDigits(3)
-        #h_ratio.GetYaxis().SetMaxDigits(2)
-        h_ratio.GetXaxis().SetNdivisions(505)
-        h_ratio.GetYaxis().SetNdivisions(505)
+
+        # Skip entirely if this histogram was already configured with the same panel settings
+        axes_key = (id(hist.panel), hist.x_label, hist.panel.y_label, hist.panel.y_min, hist.panel.y_max)
+        if getattr(h_ratio, "_axes_key", None) == axes_key:
+            return
+
+        # Resolve the axis objects once instead of per setter
+        x_axis = h_ratio.GetXaxis()
+        y_axis = h_ratio.GetYaxis()
+
+        # Batch all setters into a single pad update
+        with self._pad_hold():
+            # Set axis labels and ranges
+            x_axis.SetTitle(hist.x_label)
+            y_axis.SetTitle(hist.panel.y_label)
+            #y_axis.SetRangeUser(hist.panel.y_min, hist.panel.y_max)
+
+            # Adjust sizes for ratio panel
+            x_axis.SetLabelSize(PANEL_LABEL_SIZE)
+            x_axis.SetTitleSize(PANEL_TITLE_SIZE)
+            x_axis.SetTitleOffset(TITLE_OFFSET)
+            y_axis.SetLabelSize(PANEL_LABEL_SIZE)
+            y_axis.SetTitleSize(PANEL_TITLE_SIZE)
+            y_axis.SetTitleOffset(PANEL_TITLE_OFFSET_Y)
+
+            # Prevent label overlap
+            x_axis.SetMaxDigits(3)
+            #y_axis.SetMaxDigits(2)
+            x_axis.SetNdivisions(505)
+            y_axis.SetNdivisions(505)
+
+        h_ratio._axes_key = axes_key
@@ -1,18 +1,44 @@
 from typing import Optional, List, Union
+from functools import lru_cache
 import os
+import sys
 from .logger import package_logger
 from .constants import Style
 
+# URL schemes whose existence can only be checked by actually opening them
+_REMOTE_SCHEMES = ("root://", "http://", "https://")
+
+
+@lru_cache(maxsize=None)
+def _stat_exists(path: str) -> bool:
+    """Cached existence check: one stat syscall per unique path per interpreter."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _is_remote(path: str) -> bool:
+    """Whether the path is a remote URL that a local stat cannot check."""
+    return path.startswith(_REMOTE_SCHEMES)
+
 
 class ProcessTemplate:
+    # Instantiated once per process and again per unique name; __slots__ drops the
+    # per-instance __dict__ and interning dedupes the name strings used as dict keys
+    __slots__ = ("name", "color", "style", "error_bars", "label")
+
     def __init__(self, name: str, color: int, style: str, error_bars: bool, label: str):
-        self.name = name
+        self.name = sys.intern(name)
         self.color = color
         self.style = style
         self.error_bars = error_bars
         self.label = label if label is not None else name
 
 class Process(ProcessTemplate):
+    __slots__ = ("logger", "file_paths", "tree_name", "weight", "extra_selection", "use_rntuple", "df")
+
     def __init__(self, 
                  name: str,
                  file_path: str,
@@ -22,7 +48,8 @@ class Process(ProcessTemplate):
                  extra_selection: Optional[str] = None,
                  style: Optional[str] = Style.STACKED,
                  error_bars: Optional[bool] = True,
-                 label: Optional[str] = None):
+                 label: Optional[str] = None,
+                 use_rntuple: Optional[bool] = False):
         """
         Initialize a physics process.
         
@@ -35,20 +62,50 @@ class Process(ProcessTemplate):
             style: Style of process (stacked, line, points)
             error_bars: Whether to draw error bars
             label: Label for the process (defaults to name if not set)
+            use_rntuple: Read via a cached RNTuple conversion of the tree for faster deserialization
         """
         super().__init__(name, color, style, error_bars, label)
-        self.logger = package_logger.get_logger(f"process.{name}")
-        
-        # Validate file path and tree name
-        if not os.path.isfile(file_path):
-            self.logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        self.file_path = os.path.expandvars(file_path)
-        self.tree_name = tree_name
+
+        # All processes share one cached logger; per-name loggers would each create a log file
+        self.logger = package_logger.get_logger("process")
+
+        # Store the first input file; more can be chained with add_file. Paths are validated
+        # by the plotter when the files are prefetched, so remote opens can be overlapped.
+        self.file_paths: List[str] = []
+        self.add_file(file_path)
+        self.tree_name = sys.intern(tree_name)
         self.weight = weight
         self.extra_selection = extra_selection
-        
-        # Create RDataFrame
+        self.use_rntuple = use_rntuple
+
+        # RDataFrame, built by the plotter; the plotter also logs one batched summary of
+        # all configured processes instead of a line per construction
         self.df = None
-        self.logger.info(f"Initialized process: {self.name} with file:tree: {self.file_path}:{self.tree_name}")
+
+
+    @classmethod
+    def from_files(cls, name: str, file_paths: List[str], tree_name: str, **kwargs) -> "Process":
+        """Create one multi-file process from a list of files sharing the same tree."""
+        if not file_paths:
+            raise ValueError("from_files requires at least one file path")
+        process = cls(name, file_paths[0], tree_name, **kwargs)
+        for path in file_paths[1:]:
+            process.add_file(path)
+        return process
+
+
+    @property
+    def file_path(self) -> str:
+        """First input file, kept for log messages and single-file callers."""
+        return self.file_paths[0]
+
+
+    def add_file(self, file_path: str) -> None:
+        """Append another input file containing the same tree to this process."""
+        file_path = os.path.expandvars(file_path)
+
+        # Warn early for missing local files; remote URLs are only checkable at open time
+        if not _is_remote(file_path) and not _stat_exists(file_path):
+            self.logger.warning(f"File not found: {file_path}. The plotter will fail when prefetching it.")
+
+        self.file_paths.append(file_path)
@@ -2,77 +2,40 @@ from plotter import Plotter, Region, Histogram, Histogram2D, Panel, PanelElement
 import ROOT
 
 
-# Create processes
-Wjets_mc23a_no_veto = Process(
+# Create processes, one multi-file process per sample across MC campaigns
+Wjets_no_veto = Process.from_files(
     name="Wjets_Run3_no_veto",
     label="Wjets w/o veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Wjets_mc23a_Run3_merged.root",
+    file_paths=[
+        "/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Wjets_mc23a_Run3_merged.root",
+        "/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Wjets_mc23d_Run3_merged.root",
+    ],
     tree_name="LJAlgo/nominal",
     color=ROOT.kRed,
     style=Style.STACKED
 )
 
-Wjets_mc23d_no_veto = Process(
-    name="Wjets_Run3_no_veto",
-    label="Wjets w/o veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Wjets_mc23d_Run3_merged.root",
-    tree_name="LJAlgo/nominal",
-    color=ROOT.kRed,
-    style=Style.STACKED
-)
-
-Zjets_mc23a_no_veto = Process(
+Zjets_no_veto = Process.from_files(
     name="Zjets_Run3_no_veto",
     label="Zjets w/o veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Zjets_mc23a_Run3_merged.root",
+    file_paths=[
+        "/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Zjets_mc23a_Run3_merged.root",
+        "/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Zjets_mc23d_Run3_merged.root",
+    ],
     tree_name="LJAlgo/nominal",
     color=ROOT.kBlue,
     style=Style.STACKED
 )
 
-Zjets_mc23d_no_veto = Process(
-    name="Zjets_Run3_no_veto",
-    label="Zjets w/o veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/no_veto/Zjets_mc23d_Run3_merged.root",
-    tree_name="LJAlgo/nominal",
-    color=ROOT.kBlue,
-    style=Style.STACKED
-)
-
-Wjets_mc23a_w_veto = Process(
-    name="Run3_w_veto",
-    label="Run3 w/ veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Wjets_mc23a_Run3_merged.root",
-    tree_name="LJAlgo/nominal",
-    color=ROOT.kGreen,
-    style=Style.POINTS,
-    error_bars=True
-)
-
-Wjets_mc23d_w_veto = Process(
-    name="Run3_w_veto",
-    label="Run3 w/ veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Wjets_mc23d_Run3_merged.root",
-    tree_name="LJAlgo/nominal",
-    color=ROOT.kGreen,
-    style=Style.POINTS,
-    error_bars=True
-)
-
-Zjets_mc23a_w_veto = Process(
-    name="Run3_w_veto",
-    label="Run3 w/ veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Zjets_mc23a_Run3_merged.root",
-    tree_name="LJAlgo/nominal",
-    color=ROOT.kGreen,
-    style=Style.POINTS,
-    error_bars=True
-)
-
-Zjets_mc23d_w_veto = Process(
+Run3_w_veto = Process.from_files(
     name="Run3_w_veto",
     label="Run3 w/ veto",
-    file_path="/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Zjets_mc23d_Run3_merged.root",
+    file_paths=[
+        "/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Wjets_mc23a_Run3_merged.root",
+        "/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Wjets_mc23d_Run3_merged.root",
+        "/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Zjets_mc23a_Run3_merged.root",
+        "/data/gkehris/BadMuonVetoAnalysis/merged/w_veto/Zjets_mc23d_Run3_merged.root",
+    ],
     tree_name="LJAlgo/nominal",
     color=ROOT.kGreen,
     style=Style.POINTS,
@@ -170,14 +133,9 @@ w_veto_region = Region(
 # Create plotter and add processes and histograms
 plotter = Plotter(weight="mcEventWeight*weight_gen*weight_lumi*weight_norm*weight_singleleptonTrigSF*weight_lepton*weight_pileup*weight_btag*weight_jvt*beamSpotWeight", output_dir="test", n_threads=16)
 
-plotter.add_process(Wjets_mc23a_no_veto)
-plotter.add_process(Wjets_mc23d_no_veto)
-plotter.add_process(Zjets_mc23a_no_veto)
-plotter.add_process(Zjets_mc23d_no_veto)
-plotter.add_process(Wjets_mc23a_w_veto)
-plotter.add_process(Wjets_mc23d_w_veto)
-plotter.add_process(Zjets_mc23a_w_veto)
-plotter.add_process(Zjets_mc23d_w_veto)
+plotter.add_process(Wjets_no_veto)
+plotter.add_process(Zjets_no_veto)
+plotter.add_process(Run3_w_veto)
 
 plotter.add_histogram(pt_hist)
 plotter.add_histogram(mass_hist)